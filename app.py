@@ -1,14 +1,10 @@
 from main import ExchangeVolumeAnalyzer
 import streamlit as st
 import pandas as pd
-import plotly.graph_objs as go
-from datetime import datetime, timedelta
-from plotly.subplots import make_subplots
-import time
+import numpy as np
 import os
 
 # Configure for better deployment stability
-os.environ['CCXT_ASYNC'] = 'false'  # Disable async for better compatibility
 os.environ['CCXT_RETRY'] = 'true'   # Enable retry mechanism
 
 # Environment detection
@@ -23,21 +19,356 @@ else:
 st.set_page_config(page_title="Exchange Dominance Dashboard", layout="wide")
 st.title("Exchange Dominance & Price Dashboard")
 
-# Add session state for caching
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = ExchangeVolumeAnalyzer()
+# Exchanges covered by main.py, and their _perp-suffixed counterparts
+MAJOR_EXCHANGES = ('binance', 'bybit', 'okx', 'kucoin',
+                   'coinbase', 'kraken', 'upbit', 'bithumb')
+PERP_EXCHANGES = tuple(f'{ex}_perp' for ex in MAJOR_EXCHANGES)
+
+EXCHANGE_COLORS = {
+    'binance': '#F3BA2F',
+    'coinbase': '#0052FF',
+    'upbit': '#1C64F2',
+    'bithumb': '#FF5C5C',
+    'kraken': '#5546FF',
+    'okx': '#8B4513',
+    'bybit': '#F9D326',
+    'kucoin': '#28C893',
+}
+
+# Exchange → KR/Non-KR group membership (exact names, so a hypothetical
+# exchange containing 'bybit' as a substring can never be mis-classified)
+EXCHANGE_GROUP = {
+    'binance': 'Non-KR',
+    'coinbase': 'Non-KR',
+    'upbit': 'KR',
+    'bithumb': 'KR',
+    'kraken': 'Non-KR',
+    'okx': 'Non-KR',
+    'bybit': 'Non-KR',
+    'kucoin': 'Non-KR',
+}
+
+
+def kr_group_matrix(columns):
+    """2 x n_cols indicator matrix mapping pivot columns onto (KR, Non-KR).
+
+    Multiplying a pivot by its transpose collapses all per-group column sums
+    into a single BLAS call.
+    """
+    groups = columns.str.removesuffix('_perp').map(EXCHANGE_GROUP)
+    matrix = np.zeros((2, len(columns)), dtype=np.float32)
+    matrix[0, groups == 'KR'] = 1.0
+    matrix[1, groups == 'Non-KR'] = 1.0
+    return matrix
+
+
+def strip_perp_categories(exchange):
+    """Map a categorical exchange column onto its _perp-stripped base.
+
+    Strips the suffix on the handful of categories and remaps the integer
+    codes, rather than running a string operation over every row; the result
+    stays categorical so the following groupby hashes small ints.
+    """
+    categories = exchange.cat.categories
+    bases = [c.removesuffix('_perp') for c in categories]
+    unique_bases = list(dict.fromkeys(bases))
+    code_of = {base: i for i, base in enumerate(unique_bases)}
+    remap = np.array([code_of[base] for base in bases])
+    return pd.Categorical.from_codes(
+        remap[exchange.cat.codes.to_numpy()], unique_bases)
+
+
+def normalize_rows_pct(pivot):
+    """Row-normalize a pivot to percentages without intermediate frames.
+
+    Works on one NumPy buffer in place instead of the label-aligned
+    .div(..., axis=0) * 100 chain; all-zero rows stay at zero.
+    """
+    vals = pivot.to_numpy(copy=True)
+    row_sum = vals.sum(axis=1, keepdims=True)
+    np.divide(vals, np.where(row_sum == 0, 1, row_sum), out=vals)
+    vals *= 100.0
+    return pd.DataFrame(vals, index=pivot.index, columns=pivot.columns)
+
+
+@st.cache_data(show_spinner=False)
+def build_pivots(combined_df, volume_mode):
+    """Reshape the long fetch frame into the pivot views the charts consume.
+
+    Returns (dominance_pivot, volume_pivot, price_df, grouped_dom,
+    grouped_vol). Cached so toggling the volume mode re-reads the memo
+    instead of re-running the groupby/pivot pipeline.
+    """
+    # One groupby/unstack pass feeds both pivots; market share is derived
+    # directly from the volume pivot instead of a separate
+    # calculate_daily_market_share pass.
+    grouped = combined_df.groupby(
+        ['date', 'exchange'], sort=False, observed=True).agg(
+        {'volume_usd': 'sum', 'close': 'first'})
+    volume_pivot = grouped['volume_usd'].unstack(
+        'exchange', fill_value=0).sort_index()
+    dominance_pivot = normalize_rows_pct(volume_pivot)
+
+    # Keep the per-exchange pivot around for the display table: Spot+Perp
+    # mode replaces volume_pivot with the base-combined view below.
+    exchange_volume_pivot = volume_pivot
+
+    # Close price series (binance preferred, else first exchange) - the
+    # per-(date, exchange) close is already aggregated in `grouped`.
+    if 'close' in combined_df.columns:
+        close_by_exchange = grouped['close'].unstack('exchange')
+        if 'binance' in close_by_exchange.columns:
+            price_series = close_by_exchange['binance'].dropna()
+        else:
+            price_series = grouped['close'].groupby(level='date').first()
+        price_df = price_series.to_frame('close').sort_index()
+    else:
+        price_df = pd.DataFrame(columns=['close'])
+
+    # 선택에 따라 컬럼 필터링 및 데이터 처리
+    if volume_mode == "Spot Only":
+        # Spot Only 모드: perp 거래소 제외하고 spot만 사용
+        filtered_columns = dominance_pivot.columns.difference(PERP_EXCHANGES)
+
+        # Spot Only용 피벗 테이블 생성
+        spot_dominance_pivot = dominance_pivot[filtered_columns]
+        spot_volume_pivot = volume_pivot[filtered_columns]
+
+        # 각 날짜별로 100%로 정규화
+        spot_dominance_pivot = normalize_rows_pct(spot_dominance_pivot)
+
+        # KR/Non-KR 그룹화 (spot만)
+        group_matrix = kr_group_matrix(spot_dominance_pivot.columns)
+        grouped_dom = pd.DataFrame(
+            spot_dominance_pivot.values @ group_matrix.T,
+            index=spot_dominance_pivot.index, columns=['KR', 'Non-KR'])
+        grouped_vol = pd.DataFrame(
+            spot_volume_pivot.values @ group_matrix.T,
+            index=spot_volume_pivot.index, columns=['KR', 'Non-KR'])
+
+    else:  # Spot+Perp 모드
+        # Spot과 Perp 데이터를 합치기 위해 exchange_base 컬럼으로 재집계
+        volume_pivot = combined_df.assign(
+            exchange_base=strip_perp_categories(combined_df['exchange'])
+        ).groupby(
+            ['date', 'exchange_base'], sort=False, observed=True)[
+            'volume_usd'].sum().unstack(
+            'exchange_base', fill_value=0).sort_index()
+        dominance_pivot = normalize_rows_pct(volume_pivot)
+
+        # KR/Non-KR 그룹화 (합친 데이터 기준)
+        group_matrix = kr_group_matrix(dominance_pivot.columns)
+        grouped_dom = pd.DataFrame(
+            dominance_pivot.values @ group_matrix.T,
+            index=dominance_pivot.index, columns=['KR', 'Non-KR'])
+        grouped_vol = pd.DataFrame(
+            volume_pivot.values @ group_matrix.T,
+            index=volume_pivot.index, columns=['KR', 'Non-KR'])
+
+    return (dominance_pivot, volume_pivot, price_df,
+            grouped_dom, grouped_vol, exchange_volume_pivot)
+
+
+# Figure builders are cached so reruns with unchanged data (widget toggles,
+# resizes) reuse the previously constructed Plotly figures instead of
+# rebuilding every trace from scratch.
+@st.cache_data(show_spinner=False)
+def build_group_figure(grouped_dom, total_vol, price_df):
+    """KR vs Non-KR dominance (%) + total volume subplot figure"""
+    # Imported here so empty-input reruns skip the plotly import cost;
+    # Python caches the module after the first figure build.
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
+    # Format the date labels once and share them across traces
+    x_dates = grouped_dom.index.strftime('%Y-%m-%d')
+    x_price = price_df.index.strftime(
+        '%Y-%m-%d') if not price_df.empty else None
+
+    fig = make_subplots(
+        rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3], vertical_spacing=0.05,
+        subplot_titles=("Dominance (%)", "Total Volume (USD) - Bar Chart"),
+        specs=[[{"secondary_y": True}], [{}]]
+    )
+    # Row 1: Dominance stacked bar (y1) + close price (y2). Plain dict
+    # traces added in one batch skip the per-attribute go.Bar validation.
+    fig.add_traces([
+        dict(type='bar', name='KR', x=x_dates,
+             y=grouped_dom['KR'].to_numpy(np.float32),
+             marker=dict(color='royalblue'), opacity=1.0),
+        dict(type='bar', name='Non-KR', x=x_dates,
+             y=grouped_dom['Non-KR'].to_numpy(np.float32),
+             marker=dict(color='orange'), opacity=1.0),
+    ], rows=[1, 1], cols=[1, 1], secondary_ys=[False, False])
+
+    # Add close price line
+    if not price_df.empty:
+        fig.add_trace(go.Scattergl(
+            x=x_price,
+            y=price_df['close'].to_numpy(np.float32),
+            name='Close Price',
+            mode='lines+markers',
+            line=dict(color='black', width=2),
+            yaxis='y2'
+        ), row=1, col=1, secondary_y=True)
+    # Row 2: 전체 거래량 bar chart (단일)
+    fig.add_trace(dict(
+        type='bar',
+        x=x_dates,
+        y=total_vol.to_numpy(np.float32),
+        name='Total Volume',
+        marker=dict(color='rgba(44, 160, 101, 0.8)'),
+        opacity=0.8
+    ), row=2, col=1)
+
+    fig.update_layout(
+        barmode='stack',
+        height=650,
+        margin=dict(l=40, r=40, t=40, b=40),
+        legend=dict(x=1.05, y=1),
+    )
+    fig.update_yaxes(
+        title_text='Market Share (%)', row=1, col=1, secondary_y=False)
+    fig.update_yaxes(
+        title_text='Close Price', row=1, col=1, secondary_y=True)
+    fig.update_yaxes(
+        title_text='Total Volume (USD)', row=2, col=1)
+    fig.update_xaxes(
+        rangeslider=dict(visible=False), row=1, col=1)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def build_exchange_figure(dominance_pivot, total_vol, price_df, colors):
+    """Per-exchange dominance (%) + total volume subplot figure"""
+    # Imported here so empty-input reruns skip the plotly import cost;
+    # Python caches the module after the first figure build.
+    import plotly.graph_objs as go
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+
+    # Format the date labels once and share them across traces
+    x_dates = dominance_pivot.index.strftime('%Y-%m-%d')
+    x_price = price_df.index.strftime(
+        '%Y-%m-%d') if not price_df.empty else None
+
+    fig = make_subplots(
+        rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3], vertical_spacing=0.05,
+        subplot_titles=("Dominance (%)", "Total Volume (USD) - Bar Chart"),
+        specs=[[{"secondary_y": True}], [{}]]
+    )
+    # Row 1: Dominance stacked bar (y1) + close price (y2). A single px.bar
+    # over the long-form frame emits one compact trace group instead of a
+    # Python-level go.Bar per exchange column.
+    long_df = dominance_pivot.stack().rename('share').reset_index()
+    long_df.columns = ['date', 'exchange', 'share']
+    long_df['date'] = long_df['date'].dt.strftime('%Y-%m-%d')
+    bars = px.bar(long_df, x='date', y='share', color='exchange',
+                  color_discrete_map=colors)
+    fig.add_traces(bars.data, rows=1, cols=1)
+
+    # Add close price line if available
+    if not price_df.empty:
+        fig.add_trace(go.Scattergl(
+            x=x_price,
+            y=price_df['close'].to_numpy(np.float32),
+            name='Close Price',
+            mode='lines+markers',
+            line=dict(color='black', width=2),
+            yaxis='y2'
+        ), row=1, col=1, secondary_y=True)
+    # Row 2: 전체 거래량 bar chart (단일)
+    fig.add_trace(dict(
+        type='bar',
+        x=x_dates,
+        y=total_vol.to_numpy(np.float32),
+        name='Total Volume',
+        marker=dict(color='rgba(44, 160, 101, 0.8)'),
+        opacity=0.8
+    ), row=2, col=1)
+
+    fig.update_layout(
+        barmode='stack',
+        height=650,
+        margin=dict(l=40, r=40, t=40, b=40),
+        legend=dict(x=1.05, y=1),
+    )
+    fig.update_yaxes(title_text='Market Share (%)',
+                     row=1, col=1, secondary_y=False)
+    fig.update_yaxes(title_text='Close Price',
+                     row=1, col=1, secondary_y=True)
+    fig.update_yaxes(title_text='Total Volume (USD)', row=2, col=1)
+    fig.update_xaxes(rangeslider=dict(visible=False), row=1, col=1)
+    return fig
+
+# One analyzer per process: constructing it instantiates every ccxt
+# exchange, so share it across sessions and reruns instead of rebuilding.
+@st.cache_resource(show_spinner=False)
+def get_analyzer():
+    return ExchangeVolumeAnalyzer()
+
+
+# Cached fetch wrappers: every widget interaction triggers a full rerun, so
+# memoize the network-heavy calls per (ticker, days) for a few minutes. Only
+# primitive args are passed so st.cache_data can hash the keys.
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_historical_cached(ticker, days):
+    df = get_analyzer().fetch_historical_data(ticker, days)
+    if not df.empty:
+        # Low-cardinality keys: categorical exchange and datetime64 dates let
+        # every downstream groupby/pivot hash integer codes instead of Python
+        # strings.
+        df['exchange'] = df['exchange'].astype('category')
+        df['date'] = pd.to_datetime(df['date'])
+        # float32 halves the bytes moved through the memory-bound reshape
+        # stage; volumes and prices are display precision anyway.
+        float_cols = ['volume_base', 'volume_usd',
+                      'open', 'high', 'low', 'close']
+        df[float_cols] = df[float_cols].astype('float32')
+    return df
+
+
+class _PriceUnavailable(Exception):
+    """Raised so st.cache_data does not memoize a failed price lookup"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_current_price(ticker):
+    price = get_analyzer().get_current_price(ticker)
+    if price <= 0:
+        raise _PriceUnavailable(ticker)
+    return price
+
+
+def fetch_current_price_cached(ticker):
+    # Only successful lookups stay cached for the TTL; a transient outage
+    # returns 0.0 once and retries on the next rerun, matching the
+    # analyzer's own minute-bucket memo.
+    try:
+        return _fetch_current_price(ticker)
+    except _PriceUnavailable:
+        return 0.0
+
+# Batch the inputs behind one submit so each widget interaction does not
+# trigger its own full fetch/reshape/render pass.
+with st.form("controls"):
+    ticker_input = st.text_input(
+        "Enter token ticker (e.g., SOL, PENGU):", value="PENGU")
+    days = st.number_input("Select period (days)", min_value=2,
+                           max_value=365, value=14, step=1)
+    # Spot Only / Spot+Perp 선택
+    volume_mode = st.radio(
+        "Volume Mode", ["Spot Only", "Spot+Perp"], index=0)
+    submitted = st.form_submit_button("Update")
 
-# Ticker input with auto-formatting
-ticker_input = st.text_input(
-    "Enter token ticker (e.g., SOL, PENGU):", value="PENGU")
 # Auto-format ticker: uppercase and remove spaces
 ticker = ticker_input.strip().upper() if ticker_input else ""
-# Period input
-days = st.number_input("Select period (days)", min_value=2,
-                       max_value=365, value=14, step=1)
 
-if ticker:
-    analyzer = st.session_state.analyzer
+if submitted:
+    st.session_state.last_run = True
+
+if ticker and 'last_run' in st.session_state:
+    analyzer = get_analyzer()
 
     # Add progress tracking
     progress_bar = st.progress(0)
@@ -53,15 +384,9 @@ if ticker:
             progress_bar.progress(30)
 
             # Get historical data (excluding today)
-            historical_df = analyzer.fetch_historical_data(ticker, int(days))
-
-            status_text.text("📊 Fetching today's data...")
-            progress_bar.progress(60)
-
-            # Get today's data separately
-            today_df = analyzer.get_today_data(ticker)
+            historical_df = fetch_historical_cached(ticker, int(days))
 
-            status_text.text("🔄 Processing and combining data...")
+            status_text.text("🔄 Processing data...")
             progress_bar.progress(80)
 
             # Use only historical data for accurate comparison
@@ -72,8 +397,6 @@ if ticker:
                 "💡 Today's volume data excluded to avoid inflated comparisons with 24h data")
 
             progress_bar.progress(100)
-            status_text.text("🎉 Data processing complete!")
-            time.sleep(0.5)
             progress_bar.empty()
             status_text.empty()
 
@@ -96,13 +419,8 @@ if ticker:
         st.stop()
 
     if not combined_df.empty:
-        # Remove duplicates before pivot
         st.info(f"📊 Processing {len(combined_df)} total records")
 
-        # Remove duplicates based on date and exchange (keep the latest record)
-        combined_df = combined_df.drop_duplicates(
-            subset=['date', 'exchange'], keep='last')
-
         # Show which exchanges we have data for
         available_exchanges = combined_df['exchange'].unique()
         st.success(f"✅ Data available for: {', '.join(available_exchanges)}")
@@ -114,10 +432,8 @@ if ticker:
                 f"📊 API Connection Summary: {api_summary['successful_exchanges']} successful, {api_summary['failed_exchanges']} failed out of {api_summary['total_exchanges']} exchanges")
 
         # Show missing exchanges with detailed error information
-        expected_exchanges = ['binance', 'bybit', 'okx',
-                              'kucoin', 'coinbase', 'kraken', 'upbit', 'bithumb']
         missing_exchanges = [
-            ex for ex in expected_exchanges if ex not in available_exchanges]
+            ex for ex in MAJOR_EXCHANGES if ex not in available_exchanges]
         if missing_exchanges:
             st.warning(f"⚠️ Missing data for: {', '.join(missing_exchanges)}")
 
@@ -127,8 +443,9 @@ if ticker:
             if missing_info:
                 st.subheader("🔍 API Connection Issues Details")
 
-                for exchange_name, error_info in missing_info.items():
-                    if exchange_name in missing_exchanges:
+                for exchange_name in missing_exchanges:
+                    error_info = missing_info.get(exchange_name)
+                    if error_info is not None:
                         with st.expander(f"❌ {exchange_name.upper()} - {error_info['error_type']}"):
                             st.write(
                                 f"**Error Type:** {error_info['error_type']}")
@@ -160,32 +477,24 @@ if ticker:
             st.info(
                 "💡 This is normal for some tokens or during high traffic periods. The app will work with available data.")
 
-        # Dominance (market share) calculation
-        share_df = analyzer.calculate_daily_market_share(combined_df)
-        dominance_pivot = share_df.pivot(
-            index='date', columns='exchange', values='market_share_pct').fillna(0)
-        volume_pivot = combined_df.pivot(
-            index='date', columns='exchange', values='volume_usd').fillna(0)
-
-        # Prepare price_df for close price (binance preferred, else first exchange)
-        if 'close' in combined_df.columns:
-            if 'binance' in combined_df['exchange'].unique():
-                price_df = combined_df[combined_df['exchange'] == 'binance'][[
-                    'date', 'close']].drop_duplicates(subset=['date']).set_index('date')
-            else:
-                price_df = combined_df.groupby(
-                    'date')['close'].first().to_frame()
-            price_df = price_df.sort_index()
-        else:
-            price_df = pd.DataFrame(columns=['close'])
+        # Spot+Perp without any perp rows (common for illiquid tokens)
+        # degenerates to Spot Only - skip the re-aggregation entirely.
+        if volume_mode == "Spot+Perp" and not combined_df['exchange'].str.endswith('_perp').any():
+            st.info(
+                "No perpetual data available for this token; showing spot values.")
+            volume_mode = "Spot Only"
+
+        (dominance_pivot, volume_pivot, price_df, grouped_dom,
+         grouped_vol, exchange_volume_pivot) = build_pivots(
+            combined_df, volume_mode)
 
         # Add current price for today (with better error handling)
         current_price = 0.0
         try:
             with st.spinner("💰 Fetching current price..."):
-                current_price = analyzer.get_current_price(ticker)
+                current_price = fetch_current_price_cached(ticker)
             if current_price > 0:
-                today = datetime.now().date()
+                today = pd.Timestamp.now().normalize()
                 price_df.loc[today] = current_price
                 st.success(f"💰 Current price: ${current_price:,.4f}")
             else:
@@ -202,95 +511,6 @@ if ticker:
                 latest_price = price_df['close'].iloc[-1]
                 st.info(f"📊 Latest available price: ${latest_price:,.4f}")
 
-        krw_exchanges = ['upbit', 'bithumb']
-        exchange_colors = {
-            'binance': '#F3BA2F',
-            'coinbase': '#0052FF',
-            'upbit': '#1C64F2',
-            'bithumb': '#FF5C5C',
-            'kraken': '#5546FF',
-            'okx': '#8B4513',
-            'bybit': '#F9D326',
-            'kucoin': '#28C893',
-        }
-
-        # KRW vs Non-KRW 거래소 분류
-        krw_exchanges = ['upbit', 'bithumb']
-        non_krw_exchanges = ['binance', 'bybit',
-                             'okx', 'kucoin', 'coinbase', 'kraken']
-
-        # Perp 거래소 리스트 정의 (main.py에서 _perp 접미사 사용)
-        major_exchanges = ['binance', 'bybit', 'okx',
-                           'kucoin', 'coinbase', 'kraken', 'upbit', 'bithumb']
-        perp_exchanges = [f"{ex}_perp" for ex in major_exchanges]
-
-        # Spot Only / Spot+Perp 선택
-        volume_mode = st.radio(
-            "Volume Mode", ["Spot Only", "Spot+Perp"], index=0)
-
-        # 선택에 따라 컬럼 필터링 및 데이터 처리
-        if volume_mode == "Spot Only":
-            # Spot Only 모드: perp 거래소 제외하고 spot만 사용
-            filtered_columns = dominance_pivot.columns.difference(
-                perp_exchanges)
-
-            # KR/Non-KR 그룹화 (spot만)
-            krw_cols = [col for col in filtered_columns if any(
-                ex in col for ex in krw_exchanges)]
-            non_krw_cols = [col for col in filtered_columns if any(
-                ex in col for ex in non_krw_exchanges)]
-
-            # Spot Only용 피벗 테이블 생성
-            spot_dominance_pivot = dominance_pivot[filtered_columns]
-            spot_volume_pivot = volume_pivot[filtered_columns]
-
-            # 각 날짜별로 100%로 정규화
-            spot_dominance_pivot = spot_dominance_pivot.div(
-                spot_dominance_pivot.sum(axis=1), axis=0) * 100
-
-            grouped_dom = pd.DataFrame({
-                'KR': spot_dominance_pivot[krw_cols].sum(axis=1),
-                'Non-KR': spot_dominance_pivot[non_krw_cols].sum(axis=1)
-            })
-            grouped_vol = pd.DataFrame({
-                'KR': spot_volume_pivot[krw_cols].sum(axis=1),
-                'Non-KR': spot_volume_pivot[non_krw_cols].sum(axis=1)
-            })
-
-        else:  # Spot+Perp 모드
-            # Spot과 Perp 데이터를 합치기 위해 exchange_base 컬럼 사용
-            share_df['exchange_base'] = share_df['exchange'].str.replace(
-                '_perp', '')
-            volume_df = historical_df.copy()
-            volume_df['exchange_base'] = volume_df['exchange'].str.replace(
-                '_perp', '')
-
-            # 합친 데이터로 새로운 피벗 테이블 생성
-            combined_share = share_df.groupby(['date', 'exchange_base'])[
-                'market_share_pct'].sum().reset_index()
-            combined_volume = volume_df.groupby(['date', 'exchange_base'])[
-                'volume_usd'].sum().reset_index()
-
-            dominance_pivot = combined_share.pivot(
-                index='date', columns='exchange_base', values='market_share_pct').fillna(0)
-            volume_pivot = combined_volume.pivot(
-                index='date', columns='exchange_base', values='volume_usd').fillna(0)
-
-            # KR/Non-KR 그룹화 (합친 데이터 기준)
-            krw_cols = [col for col in dominance_pivot.columns if any(
-                ex in col for ex in krw_exchanges)]
-            non_krw_cols = [col for col in dominance_pivot.columns if any(
-                ex in col for ex in non_krw_exchanges)]
-
-            grouped_dom = pd.DataFrame({
-                'KR': dominance_pivot[krw_cols].sum(axis=1),
-                'Non-KR': dominance_pivot[non_krw_cols].sum(axis=1)
-            })
-            grouped_vol = pd.DataFrame({
-                'KR': volume_pivot[krw_cols].sum(axis=1),
-                'Non-KR': volume_pivot[non_krw_cols].sum(axis=1)
-            })
-
         total_kr_non_kr_vol = grouped_vol['KR'] + grouped_vol['Non-KR']
 
         # 1-2. KR vs Non-KR Dominance(%) + 전체 거래량 bar chart (subplot)
@@ -308,125 +528,24 @@ if ticker:
         if current_price > 0:
             st.metric("Current Price", f"${current_price:,.4f}")
 
-        fig_spot_perp = make_subplots(
-            rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3], vertical_spacing=0.05,
-            subplot_titles=("Dominance (%)", "Total Volume (USD) - Bar Chart"),
-            specs=[[{"secondary_y": True}], [{}]]
-        )
-        # Row 1: Dominance stacked bar (y1) + close price (y2)
-        fig_spot_perp.add_trace(go.Bar(
-            name='KR',
-            x=grouped_dom.index.astype(str),
-            y=grouped_dom['KR'],
-            marker_color='royalblue',
-            opacity=1.0
-        ), row=1, col=1, secondary_y=False)
-
-        fig_spot_perp.add_trace(go.Bar(
-            name='Non-KR',
-            x=grouped_dom.index.astype(str),
-            y=grouped_dom['Non-KR'],
-            marker_color='orange',
-            opacity=1.0
-        ), row=1, col=1, secondary_y=False)
-
-        # Add close price line
-        if not price_df.empty:
-            fig_spot_perp.add_trace(go.Scatter(
-                x=price_df.index.astype(str),
-                y=price_df['close'],
-                name='Close Price',
-                mode='lines+markers',
-                line=dict(color='black', width=2),
-                yaxis='y2'
-            ), row=1, col=1, secondary_y=True)
-        # Row 2: 전체 거래량 bar chart (단일)
-        fig_spot_perp.add_trace(go.Bar(
-            x=total_kr_non_kr_vol.index.astype(str),
-            y=total_kr_non_kr_vol,
-            name='Total Volume',
-            marker_color='rgba(44, 160, 101, 0.8)',
-            opacity=0.8
-        ), row=2, col=1)
-
-        fig_spot_perp.update_layout(
-            barmode='stack',
-            height=650,
-            margin=dict(l=40, r=40, t=40, b=40),
-            legend=dict(x=1.05, y=1),
-        )
-        fig_spot_perp.update_yaxes(
-            title_text='Market Share (%)', row=1, col=1, secondary_y=False)
-        fig_spot_perp.update_yaxes(
-            title_text='Close Price', row=1, col=1, secondary_y=True)
-        fig_spot_perp.update_yaxes(
-            title_text='Total Volume (USD)', row=2, col=1)
-        fig_spot_perp.update_xaxes(
-            rangeslider=dict(visible=False), row=1, col=1)
-        st.plotly_chart(fig_spot_perp, use_container_width=True)
+        fig_spot_perp = build_group_figure(
+            grouped_dom, total_kr_non_kr_vol, price_df)
+        st.plotly_chart(fig_spot_perp, use_container_width=True,
+                        key="fig_spot_perp")
 
         # 3-4. CEX별 Dominance(%) + 전체 거래량 bar chart (subplot)
         st.subheader(f"{ticker} - Exchange: Dominance (%) & Total Volume")
         total_cex_vol = volume_pivot.sum(axis=1)
-        fig_cex = make_subplots(
-            rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3], vertical_spacing=0.05,
-            subplot_titles=("Dominance (%)", "Total Volume (USD) - Bar Chart"),
-            specs=[[{"secondary_y": True}], [{}]]
-        )
-        # Row 1: Dominance stacked bar (y1) + close price (y2)
-        bar_traces = []
-        for exchange in dominance_pivot.columns:
-            bar_traces.append(go.Bar(
-                name=exchange,
-                x=dominance_pivot.index.astype(str),
-                y=dominance_pivot[exchange],
-                marker_color=exchange_colors.get(exchange, None),
-                opacity=1.0
-            ))
-
-        # Add all bar traces
-        for bar in bar_traces:
-            fig_cex.add_trace(bar, row=1, col=1, secondary_y=False)
-
-        # Add close price line if available
-        if not price_df.empty:
-            price_trace = go.Scatter(
-                x=price_df.index.astype(str),
-                y=price_df['close'],
-                name='Close Price',
-                mode='lines+markers',
-                line=dict(color='black', width=2),
-                yaxis='y2'
-            )
-            fig_cex.add_trace(price_trace, row=1, col=1, secondary_y=True)
-        # Row 2: 전체 거래량 bar chart (단일)
-        fig_cex.add_trace(go.Bar(
-            x=total_cex_vol.index.astype(str),
-            y=total_cex_vol,
-            name='Total Volume',
-            marker_color='rgba(44, 160, 101, 0.8)',
-            opacity=0.8
-        ), row=2, col=1)
-
-        fig_cex.update_layout(
-            barmode='stack',
-            height=650,
-            margin=dict(l=40, r=40, t=40, b=40),
-            legend=dict(x=1.05, y=1),
-        )
-        fig_cex.update_yaxes(title_text='Market Share (%)',
-                             row=1, col=1, secondary_y=False)
-        fig_cex.update_yaxes(title_text='Close Price',
-                             row=1, col=1, secondary_y=True)
-        fig_cex.update_yaxes(title_text='Total Volume (USD)', row=2, col=1)
-        fig_cex.update_xaxes(rangeslider=dict(visible=False), row=1, col=1)
-        st.plotly_chart(fig_cex, use_container_width=True)
+        fig_cex = build_exchange_figure(
+            dominance_pivot, total_cex_vol, price_df, EXCHANGE_COLORS)
+        st.plotly_chart(fig_cex, use_container_width=True, key="fig_cex")
 
         # Table: Exchange volume (moved below charts)
         st.subheader(f"{ticker} - {days}-Day Exchange Volume Table")
-        volume_table = combined_df.pivot(
-            index='date', columns='exchange', values='volume_usd').fillna(0).round(2)
-        st.dataframe(volume_table)
+        volume_table = exchange_volume_pivot.round(2)
+        # Streamlit serializes the frame to Arrow for the frontend anyway;
+        # Arrow-backed values make that conversion zero-copy.
+        st.dataframe(volume_table.astype('float64[pyarrow]'))
     else:
         st.warning(f"No historical data available for {ticker}.")
         st.info(
@@ -1,16 +1,224 @@
 import ccxt
+import ccxt.async_support as ccxt_async
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import asyncio
+import io
+import sys
 import time
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import json
+import logging
+import pickle
+import threading
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import random
 import os
 
+# Parse exchange responses with orjson when available - the market catalogs
+# from load_markets are hundreds of KB per exchange, and orjson decodes them
+# several times faster than stdlib json. ccxt routes all response parsing
+# through Exchange.on_json_response, so one override covers sync and async.
+try:
+    import orjson
+    ccxt.Exchange.on_json_response = orjson.loads
+except ImportError:
+    pass
+
+# Fetch-path diagnostics go through logging so the tight retry/ticker loops
+# don't pay for synchronous stdout flushes; silent by default (NullHandler),
+# the CLI and app opt in via basicConfig.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Enhanced headers for all environments
+ENHANCED_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Ranking-line templates, parsed once instead of per line (and the shared
+# prefix is no longer duplicated across the two branches)
+_RANK_PERP_TMPL = ('{i}. {name}: ${total:,.0f} ({share:.1f}%) '
+                   '[Spot: ${spot:,.0f}, Perp: ${perp:,.0f}]')
+_RANK_SPOT_TMPL = '{i}. {name}: ${total:,.0f} ({share:.1f}%) [Spot only]'
+
+# Exchange-specific Origin/Referer additions
+EXCHANGE_ORIGINS = {
+    'binance': 'https://www.binance.com',
+    'bybit': 'https://www.bybit.com',
+    'kraken': 'https://www.kraken.com',
+    'coinbase': 'https://pro.coinbase.com',
+    'okx': 'https://www.okx.com',
+    'kucoin': 'https://www.kucoin.com'
+}
+
+
+def _exchange_headers(exchange_name):
+    """Build the request headers for an exchange"""
+    headers = ENHANCED_HEADERS.copy()
+    origin = EXCHANGE_ORIGINS.get(exchange_name)
+    if origin:
+        headers.update({'Origin': origin, 'Referer': origin + '/'})
+    return headers
+
+
+@lru_cache(maxsize=2)
+def _build_configs(streamlit_cloud):
+    """Pre-merge the per-exchange ccxt configs for an environment.
+
+    The nested dict merges only depend on whether we run on Streamlit
+    Cloud, so they are computed once per process instead of on every
+    analyzer construction (Streamlit re-instantiates on session
+    bootstrap). ccxt constructors deep-copy their config, so sharing the
+    cached dicts is safe.
+    """
+    if streamlit_cloud:
+        # More conservative settings for Streamlit Cloud
+        common_config = {
+            'enableRateLimit': True,
+            'timeout': 45000,  # 45 seconds (under Streamlit's 60s limit)
+            'rateLimit': 500,  # 500ms between requests (more conservative)
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+            }
+        }
+
+        # Even more conservative for problematic exchanges
+        binance_config = {
+            'enableRateLimit': True,
+            'timeout': 45000,  # 45 seconds
+            'rateLimit': 1000,  # 1 second between requests
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+                'recvWindow': 60000,
+                'warnOnFetchOHLCVLimitArgument': False,
+            }
+        }
+
+        bybit_config = {
+            'enableRateLimit': True,
+            'timeout': 45000,  # 45 seconds
+            'rateLimit': 1000,  # 1 second between requests
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+            }
+        }
+    else:
+        # Local development settings
+        common_config = {
+            'enableRateLimit': True,
+            'timeout': 20000,  # 20 seconds timeout
+            'rateLimit': 150,  # 150ms between requests
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+            }
+        }
+
+        binance_config = {
+            'enableRateLimit': True,
+            'timeout': 30000,  # 30 seconds timeout
+            'rateLimit': 300,  # 300ms between requests
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+                'recvWindow': 60000,
+                'warnOnFetchOHLCVLimitArgument': False,
+            }
+        }
+
+        bybit_config = {
+            'enableRateLimit': True,
+            'timeout': 30000,  # 30 seconds timeout
+            'rateLimit': 300,  # 300ms between requests
+            'options': {
+                'defaultType': 'spot',
+                'adjustForTimeDifference': True,
+            }
+        }
+
+    spot_configs = {
+        'binance': binance_config,
+        'coinbase': {**common_config, 'options': {**common_config['options'], 'sandbox': False}},
+        'upbit': {**common_config},
+        'bithumb': {**common_config},
+        'kraken': {**common_config},
+        'okx': {**common_config},
+        'bybit': bybit_config,
+        'kucoin': {**common_config}
+    }
+
+    futures_config = {**common_config,
+                      'options': {**common_config['options']}}
+    futures_configs = {
+        'binance': {**futures_config, 'options': {**futures_config['options'], 'defaultType': 'future', 'recvWindow': 60000}},
+        'okx': {**futures_config, 'options': {**futures_config['options'], 'defaultType': 'swap'}},
+        'bybit': {**futures_config, 'options': {**futures_config['options'], 'defaultType': 'linear'}},
+        'kucoin': {**futures_config, 'options': {**futures_config['options'], 'defaultType': 'swap'}}
+    }
+    return spot_configs, futures_configs
+
+
+class _LazyExchangeDict:
+    """Mapping of exchange name -> ccxt client, constructed on first access.
+
+    Building a ccxt client allocates a session and parses its market
+    descriptions, so paths that only touch one or two exchanges (e.g.
+    get_current_price) shouldn't pay for all twelve up front.
+    """
+
+    def __init__(self, factory, names):
+        self._factory = factory
+        self._names = tuple(names)
+        self._instances = {}
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        if name not in self._instances:
+            self._instances[name] = self._factory(name)
+        return self._instances[name]
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def keys(self):
+        return self._names
+
+    def values(self):
+        return [self[name] for name in self._names]
+
+    def items(self):
+        return [(name, self[name]) for name in self._names]
+
 
 class ExchangeVolumeAnalyzer:
     def __init__(self):
@@ -24,189 +232,97 @@ class ExchangeVolumeAnalyzer:
         self.api_errors = {}
         self.connection_status = {}
 
-        # Enhanced headers for all environments
-        self.enhanced_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-origin',
-            'DNT': '1',
-            'Upgrade-Insecure-Requests': '1'
-        }
-
         # Streamlit Cloud specific settings
         if self.is_streamlit_cloud:
-            print("🔧 Detected Streamlit Cloud environment - applying optimized settings")
-            # More conservative settings for Streamlit Cloud
-            common_config = {
-                'enableRateLimit': True,
-                'timeout': 45000,  # 45 seconds (under Streamlit's 60s limit)
-                'rateLimit': 500,  # 500ms between requests (more conservative)
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                }
-            }
-
-            # Even more conservative for problematic exchanges
-            binance_config = {
-                'enableRateLimit': True,
-                'timeout': 45000,  # 45 seconds
-                'rateLimit': 1000,  # 1 second between requests
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                    'recvWindow': 60000,
-                    'warnOnFetchOHLCVLimitArgument': False,
-                }
-            }
-
-            bybit_config = {
-                'enableRateLimit': True,
-                'timeout': 45000,  # 45 seconds
-                'rateLimit': 1000,  # 1 second between requests
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                }
-            }
-        else:
-            # Local development settings
-            common_config = {
-                'enableRateLimit': True,
-                'timeout': 20000,  # 20 seconds timeout
-                'rateLimit': 150,  # 150ms between requests
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                }
-            }
-
-            binance_config = {
-                'enableRateLimit': True,
-                'timeout': 30000,  # 30 seconds timeout
-                'rateLimit': 300,  # 300ms between requests
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                    'recvWindow': 60000,
-                    'warnOnFetchOHLCVLimitArgument': False,
-                }
-            }
-
-            bybit_config = {
-                'enableRateLimit': True,
-                'timeout': 30000,  # 30 seconds timeout
-                'rateLimit': 300,  # 300ms between requests
-                'options': {
-                    'defaultType': 'spot',
-                    'adjustForTimeDifference': True,
-                }
-            }
-
-        # Initialize exchanges with appropriate configs
-        self.exchanges = {
-            'binance': ccxt.binance(binance_config),
-            'coinbase': ccxt.coinbase({**common_config, 'options': {**common_config['options'], 'sandbox': False}}),
-            'upbit': ccxt.upbit({**common_config}),
-            'bithumb': ccxt.bithumb({**common_config}),
-            'kraken': ccxt.kraken({**common_config}),
-            'okx': ccxt.okx({**common_config}),
-            'bybit': ccxt.bybit(bybit_config),
-            'kucoin': ccxt.kucoin({**common_config})
-        }
-
-        # Add enhanced headers to all exchanges
-        for exchange_name, exchange in self.exchanges.items():
-            exchange.headers = self.enhanced_headers.copy()
-
-            # Add exchange-specific headers
-            if exchange_name == 'binance':
-                exchange.headers.update({
-                    'Origin': 'https://www.binance.com',
-                    'Referer': 'https://www.binance.com/',
-                })
-            elif exchange_name == 'bybit':
-                exchange.headers.update({
-                    'Origin': 'https://www.bybit.com',
-                    'Referer': 'https://www.bybit.com/',
-                })
-            elif exchange_name == 'kraken':
-                exchange.headers.update({
-                    'Origin': 'https://www.kraken.com',
-                    'Referer': 'https://www.kraken.com/',
-                })
-            elif exchange_name == 'coinbase':
-                exchange.headers.update({
-                    'Origin': 'https://pro.coinbase.com',
-                    'Referer': 'https://pro.coinbase.com/',
-                })
-            elif exchange_name == 'okx':
-                exchange.headers.update({
-                    'Origin': 'https://www.okx.com',
-                    'Referer': 'https://www.okx.com/',
-                })
-            elif exchange_name == 'kucoin':
-                exchange.headers.update({
-                    'Origin': 'https://www.kucoin.com',
-                    'Referer': 'https://www.kucoin.com/',
-                })
+            logger.info("🔧 Detected Streamlit Cloud environment - applying optimized settings")
+
+        # Pre-merged per-environment configs, shared process-wide
+        # (configs kept around so async counterparts can be built on demand)
+        self.spot_configs, self.futures_configs = _build_configs(
+            self.is_streamlit_cloud)
+
+        # Shared HTTP session with connection pooling - keep-alive reuses the
+        # TCP+TLS connection across the dozens of calls made per report
+        # instead of paying a fresh handshake on every request.
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=None))
+        self._http_session.mount('https://', adapter)
+        self._http_session.mount('http://', adapter)
+
+        # Clients are constructed lazily on first access so that paths
+        # touching one or two exchanges don't pay for all of them
+        self.exchanges = _LazyExchangeDict(
+            self._make_spot_exchange, self.spot_configs)
 
         # Futures exchanges (support perpetual contracts)
-        futures_config = {**common_config,
-                          'options': {**common_config['options']}}
-        self.futures_exchanges = {
-            'binance': ccxt.binance({**futures_config, 'options': {**futures_config['options'], 'defaultType': 'future', 'recvWindow': 60000}}),
-            'okx': ccxt.okx({**futures_config, 'options': {**futures_config['options'], 'defaultType': 'swap'}}),
-            'bybit': ccxt.bybit({**futures_config, 'options': {**futures_config['options'], 'defaultType': 'linear'}}),
-            'kucoin': ccxt.kucoin({**futures_config, 'options': {**futures_config['options'], 'defaultType': 'swap'}})
-        }
-
-        # Add enhanced headers to futures exchanges too
-        for exchange_name, exchange in self.futures_exchanges.items():
-            exchange.headers = self.enhanced_headers.copy()
-
-            # Add exchange-specific headers for futures
-            if exchange_name == 'binance':
-                exchange.headers.update({
-                    'Origin': 'https://www.binance.com',
-                    'Referer': 'https://www.binance.com/',
-                })
-            elif exchange_name == 'bybit':
-                exchange.headers.update({
-                    'Origin': 'https://www.bybit.com',
-                    'Referer': 'https://www.bybit.com/',
-                })
-            elif exchange_name == 'okx':
-                exchange.headers.update({
-                    'Origin': 'https://www.okx.com',
-                    'Referer': 'https://www.okx.com/',
-                })
-            elif exchange_name == 'kucoin':
-                exchange.headers.update({
-                    'Origin': 'https://www.kucoin.com',
-                    'Referer': 'https://www.kucoin.com/',
-                })
+        self.futures_exchanges = _LazyExchangeDict(
+            self._make_futures_exchange, self.futures_configs)
+
+        # Per-exchange load_markets() cache: (exchange_name, futures) ->
+        # (monotonic timestamp, markets). The market catalog is a large
+        # download that changes at most a few times per day (listings /
+        # delistings), so a 6-hour TTL is plenty.
+        self._markets_cache = {}
+        self._markets_ttl = 21600
+
+        # Resolved perp symbols per (exchange, coin) - the markets scan only
+        # has to run once per pair, then every method reuses the result
+        self._perp_symbol_cache = {}
+
+        # Current-price memo: coin -> (minute bucket, price). Streamlit
+        # reruns the script on every UI interaction; this keeps that from
+        # re-querying five exchanges each time.
+        self._price_cache = {}
+
+        # On-disk cache for fetched volume/OHLCV results. Fresh entries are
+        # served directly; stale-but-usable entries are served immediately
+        # while a background thread refreshes them (stale-while-revalidate),
+        # so repeat reports never block on the exchanges.
+        self._disk_cache_dir = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '.volume_cache')
+        self._refresh_threads = {}
+
+        # KRW per USD, fetched lazily from upbit's USDT/KRW ticker so both
+        # conversion paths use the same live rate (fallback below)
+        self._krw_per_usd = None
 
         # KRW-based exchanges
-        self.krw_exchanges = ['upbit', 'bithumb']
+        self.krw_exchanges = frozenset(['upbit', 'bithumb'])
 
         # Exchange priority (more reliable ones first)
         self.exchange_priority = [
             'kraken', 'coinbase', 'okx', 'kucoin', 'upbit', 'bithumb', 'binance', 'bybit']
 
+    def _make_spot_exchange(self, exchange_name):
+        """Construct a configured sync spot client (called lazily)"""
+        exchange = getattr(ccxt, exchange_name)(self.spot_configs[exchange_name])
+        exchange.headers = _exchange_headers(exchange_name)
+        exchange.session = self._http_session
+        return exchange
+
+    def _make_futures_exchange(self, exchange_name):
+        """Construct a configured sync futures client (called lazily)"""
+        exchange = getattr(ccxt, exchange_name)(
+            self.futures_configs[exchange_name])
+        exchange.headers = _exchange_headers(exchange_name)
+        exchange.session = self._http_session
+        return exchange
+
     def _retry_request(self, func, max_retries=3, base_delay=1):
-        """Retry function with exponential backoff"""
+        """Retry function with exponential backoff.
+
+        Only transient errors (rate limits, network failures) are retried;
+        permanent ones such as BadSymbol propagate immediately so the
+        success path pays no extra latency.
+        """
         for attempt in range(max_retries):
             try:
                 return func()
-            except Exception as e:
+            except (ccxt.RateLimitExceeded, ccxt.NetworkError) as e:
                 if attempt == max_retries - 1:
                     raise e
 
@@ -216,7 +332,7 @@ class ExchangeVolumeAnalyzer:
                 else:
                     delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
 
-                print(
+                logger.debug(
                     f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s...")
                 time.sleep(delay)
 
@@ -231,7 +347,7 @@ class ExchangeVolumeAnalyzer:
                 self._track_success(exchange_name, f"fetch_ticker({symbol})")
             return result
         except Exception as e:
-            print(f"❌ {exchange_name} ticker fetch failed after retries: {str(e)}")
+            logger.warning(f"❌ {exchange_name} ticker fetch failed after retries: {str(e)}")
             self._track_error(exchange_name, f"fetch_ticker({symbol})", e)
             return None
 
@@ -247,7 +363,7 @@ class ExchangeVolumeAnalyzer:
                     exchange_name, f"fetch_ohlcv({symbol}, {timeframe})")
             return result
         except Exception as e:
-            print(f"❌ {exchange_name} OHLCV fetch failed after retries: {str(e)}")
+            logger.warning(f"❌ {exchange_name} OHLCV fetch failed after retries: {str(e)}")
             self._track_error(
                 exchange_name, f"fetch_ohlcv({symbol}, {timeframe})", e)
             return None
@@ -263,10 +379,361 @@ class ExchangeVolumeAnalyzer:
                 self._track_success(exchange_name, "load_markets")
             return result
         except Exception as e:
-            print(f"❌ {exchange_name} markets load failed after retries: {str(e)}")
+            logger.warning(f"❌ {exchange_name} markets load failed after retries: {str(e)}")
             self._track_error(exchange_name, "load_markets", e)
             return None
 
+    def _perp_symbols(self, exchange_name, coin, markets):
+        """Return the exchange's perp symbols for a coin, scanning markets once.
+
+        The scan result is cached per (exchange, coin) so repeated 24h and
+        historical fetches skip the O(markets) pass.
+        """
+        key = (exchange_name, coin)
+        symbols = self._perp_symbol_cache.get(key)
+        if symbols is None:
+            # Fast path: ccxt's unified perp symbols have a known shape, so
+            # try exact dict lookups before falling back to a full scan
+            usdt_pair = f'{coin}/USDT'
+            usdt_settled = f'{coin}:USDT'
+            symbols = [s for s in (f'{usdt_pair}:USDT', usdt_pair)
+                       if s in markets]
+            if not symbols:
+                symbols = [s for s in markets
+                           if usdt_pair in s or usdt_settled in s]
+            self._perp_symbol_cache[key] = symbols
+        return symbols
+
+    def _cached_markets(self, exchange_name, futures=False):
+        """Return cached markets for an exchange if still within the TTL"""
+        cached = self._markets_cache.get((exchange_name, futures))
+        if cached and time.monotonic() - cached[0] < self._markets_ttl:
+            return cached[1]
+        return None
+
+    def _store_markets(self, exchange_name, markets, futures=False):
+        """Store freshly loaded markets plus a base-coin symbol index.
+
+        The index gives O(1) lookup of all symbols for a base currency
+        (ccxt's Python build has no markets_by_base), replacing linear
+        scans of the full market catalog.
+        """
+        symbols_by_base = {}
+        for symbol, market in markets.items():
+            base = market.get('base') if isinstance(market, dict) else None
+            if base:
+                symbols_by_base.setdefault(base, []).append(symbol)
+        self._markets_cache[(exchange_name, futures)] = (
+            time.monotonic(), markets, symbols_by_base)
+
+    def _cached_symbols_by_base(self, exchange_name, futures=False):
+        """Return the cached base-coin symbol index if still within the TTL"""
+        cached = self._markets_cache.get((exchange_name, futures))
+        if cached and time.monotonic() - cached[0] < self._markets_ttl:
+            return cached[2]
+        return None
+
+    KRW_PER_USD_FALLBACK = 1350.0
+
+    def _get_krw_rate(self) -> float:
+        """Return KRW per USD, fetched once from upbit's USDT/KRW ticker.
+
+        Falls back to a fixed rate when the ticker is unavailable. Must be
+        called from sync context (the async tasks read the cached value).
+        """
+        if self._krw_per_usd is None:
+            rate = 0
+            try:
+                ticker = self._safe_fetch_ticker(
+                    self.exchanges['upbit'], 'USDT/KRW', 'upbit')
+                if ticker:
+                    rate = ticker.get('last', 0) or 0
+            except Exception as e:
+                logger.warning(f"⚠️ USD/KRW rate fetch failed: {str(e)}")
+
+            if rate > 0:
+                self._krw_per_usd = float(rate)
+                logger.info(f"💱 Using live USD/KRW rate: {rate:,.0f}")
+            else:
+                self._krw_per_usd = self.KRW_PER_USD_FALLBACK
+                logger.info(
+                    f"💱 Using fallback USD/KRW rate: {self.KRW_PER_USD_FALLBACK:,.0f}")
+
+        return self._krw_per_usd
+
+    def _disk_cache_get(self, key, fresh_ttl, max_ttl):
+        """Read a cached value from disk.
+
+        Returns (value, is_stale) where is_stale means the entry is older
+        than fresh_ttl but still younger than max_ttl, or None when there is
+        no usable entry.
+        """
+        path = os.path.join(self._disk_cache_dir, f'{key}.pkl')
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age >= max_ttl:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f), age >= fresh_ttl
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _disk_cache_put(self, key, value):
+        """Write a value to the on-disk cache"""
+        try:
+            os.makedirs(self._disk_cache_dir, exist_ok=True)
+            path = os.path.join(self._disk_cache_dir, f'{key}.pkl')
+            with open(path, 'wb') as f:
+                pickle.dump(value, f)
+        except (OSError, pickle.PickleError) as e:
+            logger.warning(f"⚠️ Disk cache write failed for {key}: {str(e)}")
+
+    def _refresh_in_background(self, key, fetch):
+        """Refresh a stale cache entry without blocking the caller"""
+        if self._refresh_threads.get(key, None) and self._refresh_threads[key].is_alive():
+            return
+
+        def refresh():
+            try:
+                self._disk_cache_put(key, fetch())
+            except Exception as e:
+                logger.warning(f"⚠️ Background refresh failed for {key}: {str(e)}")
+
+        thread = threading.Thread(target=refresh, daemon=True)
+        self._refresh_threads[key] = thread
+        thread.start()
+
+    def _build_async_exchange(self, exchange_name, futures=False):
+        """Create a ccxt.async_support counterpart of a configured exchange"""
+        configs = self.futures_configs if futures else self.spot_configs
+
+        exchange = getattr(ccxt_async, exchange_name)(configs[exchange_name])
+        exchange.headers = _exchange_headers(exchange_name)
+        return exchange
+
+    async def _retry_request_async(self, func, max_retries=3, base_delay=1):
+        """Retry async function with exponential backoff (non-blocking sleep).
+
+        Like _retry_request, only transient errors are retried; permanent
+        ones such as BadSymbol propagate immediately. The jittered delay is
+        capped so one slow exchange cannot stall a whole gather batch.
+        """
+        for attempt in range(max_retries):
+            try:
+                return await func()
+            except (ccxt.RateLimitExceeded, ccxt.NetworkError) as e:
+                if attempt == max_retries - 1:
+                    raise e
+
+                # Streamlit Cloud: longer delays
+                if self.is_streamlit_cloud:
+                    delay = base_delay * (3 ** attempt) + random.uniform(1, 3)
+                else:
+                    delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                delay = min(delay, 30)
+
+                logger.debug(
+                    f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s...")
+                await asyncio.sleep(delay)
+
+    async def _fetch_ohlcv_task(self, exchange_name, symbol, coin, timeframe, limit, futures=False):
+        """Fetch OHLCV from a single exchange for use with asyncio.gather.
+
+        Resolves the perpetual symbol from the loaded markets when `futures`
+        is True. Returns (exchange_name, resolved_symbol, ohlcv_or_None,
+        futures) and always closes the async client to avoid leaking aiohttp
+        sessions.
+        """
+        label = 'perp' if futures else 'spot'
+        exchange = self._build_async_exchange(exchange_name, futures=futures)
+        try:
+            markets = self._cached_markets(exchange_name, futures=futures)
+            if markets is not None:
+                exchange.set_markets(markets)
+            else:
+                try:
+                    markets = await self._retry_request_async(
+                        exchange.load_markets, max_retries=3, base_delay=1)
+                    self._track_success(exchange_name, "load_markets")
+                    self._store_markets(exchange_name, markets, futures=futures)
+                except Exception as e:
+                    logger.warning(
+                        f"❌ {exchange_name} markets load failed after retries: {str(e)}")
+                    self._track_error(exchange_name, "load_markets", e)
+                    return exchange_name, symbol, None, futures
+
+            if futures:
+                perp_symbols = self._perp_symbols(exchange_name, coin, markets)
+                symbol = perp_symbols[0] if perp_symbols else None
+
+                if not symbol:
+                    logger.info(
+                        f"⚠️ {exchange_name} does not support {coin} perpetual")
+                    return exchange_name, symbol, None, futures
+            elif symbol not in markets:
+                logger.info(f"⚠️ {exchange_name} does not support {symbol} (spot)")
+                return exchange_name, symbol, None, futures
+
+            try:
+                ohlcv = await self._retry_request_async(
+                    lambda: exchange.fetch_ohlcv(symbol, timeframe, limit=limit),
+                    max_retries=3, base_delay=2)
+                if ohlcv:
+                    self._track_success(
+                        exchange_name, f"fetch_ohlcv({symbol}, {timeframe})")
+                return exchange_name, symbol, ohlcv, futures
+            except Exception as e:
+                logger.warning(
+                    f"❌ {exchange_name} {label} OHLCV fetch failed after retries: {str(e)}")
+                self._track_error(
+                    exchange_name, f"fetch_ohlcv({symbol}, {timeframe})", e)
+                return exchange_name, symbol, None, futures
+        finally:
+            await exchange.close()
+
+    async def _fetch_24h_task(self, exchange_name, coin, futures=False):
+        """Fetch 24h ticker volume from a single exchange for asyncio.gather.
+
+        Returns (exchange_name, symbol_data, exchange_volume_usd, futures).
+        All per-symbol fetch_ticker calls for the exchange are dispatched
+        concurrently; the async client is always closed to avoid leaking
+        aiohttp sessions.
+        """
+        label = 'perp' if futures else 'spot'
+        exchange = self._build_async_exchange(exchange_name, futures=futures)
+        try:
+            logger.debug(f"🔍 Processing {exchange_name}{' perpetual' if futures else ''}...")
+
+            markets = self._cached_markets(exchange_name, futures=futures)
+            if markets is not None:
+                exchange.set_markets(markets)
+            else:
+                try:
+                    markets = await self._retry_request_async(
+                        exchange.load_markets, max_retries=3, base_delay=1)
+                    self._track_success(exchange_name, "load_markets")
+                    self._store_markets(exchange_name, markets, futures=futures)
+                except Exception as e:
+                    logger.warning(
+                        f"❌ {exchange_name} markets load failed after retries: {str(e)}")
+                    self._track_error(exchange_name, "load_markets", e)
+                    return exchange_name, {}, 0, futures
+
+            # Quote currency -> USD rate, looked up from the parsed market
+            # instead of repeated symbol.endswith() checks (KRW rate is
+            # prefetched in sync context)
+            quote_to_usd = {'USDT': 1.0, 'USDC': 1.0, 'USD': 1.0,
+                            'KRW': 1.0 / self._krw_per_usd}
+
+            if futures:
+                symbols = self._perp_symbols(exchange_name, coin, markets)
+            else:
+                # Hoist the prefix so the scan does one slice compare per
+                # symbol instead of rebuilding the f-string each iteration.
+                # Only spot markets with USD-convertible quotes are kept:
+                # derivative pairs belong to the perp task, and BTC/ETH/EUR-
+                # quoted pairs would be fetched and then dropped at
+                # conversion, so filtering here saves their ticker
+                # round-trips outright.
+                prefix = f'{coin}/'
+                plen = len(prefix)
+                symbols = [s for s in markets
+                           if s[:plen] == prefix
+                           and markets[s].get('spot')
+                           and markets[s].get('quote') in quote_to_usd]
+
+            if not symbols:
+                logger.info(f"⚠️ {exchange_name} does not support {coin} {label} pairs")
+                return exchange_name, {}, 0, futures
+
+            async def fetch_one(symbol):
+                try:
+                    ticker = await self._retry_request_async(
+                        lambda: exchange.fetch_ticker(symbol),
+                        max_retries=3, base_delay=2)
+                    if ticker:
+                        self._track_success(
+                            exchange_name, f"fetch_ticker({symbol})")
+                    return symbol, ticker
+                except Exception as e:
+                    logger.debug(
+                        f"⚠️ {exchange_name} {symbol} {label} data fetch failed: {str(e)}")
+                    self._track_error(
+                        exchange_name, f"fetch_ticker({symbol})", e)
+                    return symbol, None
+
+            # Prefer one batched fetch_tickers request over a per-symbol
+            # fan-out - fewer round-trips and less rate-limit pressure.
+            tickers = None
+            if exchange.has.get('fetchTickers'):
+                try:
+                    batch = await self._retry_request_async(
+                        lambda: exchange.fetch_tickers(symbols),
+                        max_retries=3, base_delay=2)
+                    self._track_success(exchange_name, "fetch_tickers")
+                    tickers = list(batch.items())
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️ {exchange_name} batched {label} tickers failed, "
+                        f"falling back to per-symbol: {str(e)}")
+                    self._track_error(exchange_name, "fetch_tickers", e)
+
+            if tickers is None:
+                # Bound in-flight requests per exchange so a coin with many
+                # pairs cannot burst one venue into 429s, while exchanges
+                # still run fully in parallel with each other
+                sema = asyncio.Semaphore(4)
+
+                async def fetch_bounded(symbol):
+                    async with sema:
+                        return await fetch_one(symbol)
+
+                tickers = await asyncio.gather(
+                    *(fetch_bounded(s) for s in symbols))
+
+            exchange_volume = 0
+            exchange_data = {}
+            # One clock read covers every symbol missing a ticker timestamp
+            now_ms = int(time.time() * 1000)
+            for symbol, ticker in tickers:
+                if not ticker:
+                    continue
+
+                volume_24h = ticker.get('quoteVolume', 0) or ticker.get(
+                    'baseVolume', 0) or 0
+                if volume_24h <= 0:
+                    continue
+
+                if futures:
+                    # Perp volume is already in USD
+                    volume_usd = volume_24h
+                else:
+                    # Only true spot markets count here - derivative pairs
+                    # (e.g. PENGU/USDT:USDT) share the USDT quote but belong
+                    # to the perp task, and counting them would double them
+                    # in the totals
+                    market = markets.get(symbol)
+                    if not market or not market.get('spot'):
+                        continue
+                    rate = quote_to_usd.get(market.get('quote'))
+                    if rate is None:
+                        # Non-USD/KRW quote (e.g. BTC pair) - no conversion
+                        continue
+                    volume_usd = volume_24h * rate
+
+                exchange_volume += volume_usd
+                exchange_data[symbol] = {
+                    'volume_24h': volume_24h,
+                    'volume_usd': volume_usd,
+                    'price': ticker.get('last', 0),
+                    'timestamp': ticker.get('timestamp') or now_ms,
+                    'type': label
+                }
+
+            return exchange_name, exchange_data, exchange_volume, futures
+        finally:
+            await exchange.close()
+
     def _track_error(self, exchange_name: str, operation: str, error: Exception):
         """Track detailed error information for UI display"""
         error_info = {
@@ -282,14 +749,21 @@ class ExchangeVolumeAnalyzer:
         if hasattr(error, 'response'):
             error_info['status_code'] = getattr(
                 error.response, 'status_code', None)
-            error_info['response_text'] = getattr(error.response, 'text', None)
+            response_text = getattr(error.response, 'text', None)
+            if response_text:
+                # Cap the stored body - some venues return full HTML error
+                # pages and only the first part is ever shown in the UI
+                error_info['response_text'] = response_text[:512]
+            else:
+                error_info['response_text'] = response_text
 
         if hasattr(error, 'args') and error.args:
             error_info['error_args'] = str(error.args)
 
-        # Store error by exchange
+        # Store error by exchange, bounded so a flaky network day can't
+        # grow a long-running Streamlit session without limit
         if exchange_name not in self.api_errors:
-            self.api_errors[exchange_name] = []
+            self.api_errors[exchange_name] = deque(maxlen=50)
         self.api_errors[exchange_name].append(error_info)
 
         # Update connection status
@@ -323,7 +797,7 @@ class ExchangeVolumeAnalyzer:
                 summary['error_details'][exchange_name] = {
                     'error_count': len(self.api_errors[exchange_name]),
                     'last_error': self.api_errors[exchange_name][-1] if self.api_errors[exchange_name] else None,
-                    'all_errors': self.api_errors[exchange_name]
+                    'all_errors': list(self.api_errors[exchange_name])
                 }
             else:
                 summary['successful_exchanges'] += 1
@@ -355,181 +829,146 @@ class ExchangeVolumeAnalyzer:
 
         for exchange_name, exchange in self.exchanges.items():
             try:
-                markets = exchange.load_markets()
-                symbols = []
+                by_base = self._cached_symbols_by_base(exchange_name)
+                if by_base is None:
+                    self._store_markets(exchange_name, exchange.load_markets())
+                    by_base = self._cached_symbols_by_base(exchange_name)
 
-                # Find all pairs for the base coin
-                for symbol in markets:
-                    if symbol.startswith(f'{base_coin}/'):
-                        symbols.append(symbol)
+                # All pairs for the base coin via the O(1) index
+                symbols = list(by_base.get(base_coin, []))
 
                 if symbols:
                     supported_symbols[exchange_name] = symbols
-                    print(f"{exchange_name}: {symbols}")
+                    logger.info(f"{exchange_name}: {symbols}")
 
             except Exception as e:
-                print(f"{exchange_name} symbol fetch failed: {str(e)}")
+                logger.warning(f"{exchange_name} symbol fetch failed: {str(e)}")
 
         return supported_symbols
 
     def fetch_24h_volume_data(self, coin: str = 'SOL') -> Dict[str, Dict]:
-        """Fetch 24h volume data including spot and perpetual futures"""
-        print(f"🔍 Fetching 24h volume data for {coin}...")
-        volume_data = {}
-        total_volume_usd = 0
+        """Fetch 24h volume data including spot and perpetual futures.
 
-        # Fetch spot volume data - use priority order for Streamlit Cloud
-        for exchange_name in self.exchange_priority:
-            if exchange_name not in self.exchanges:
-                continue
+        Results are cached on disk: entries younger than 60s are served
+        directly, older-but-recent entries are served immediately while a
+        background thread refreshes them.
+        """
+        key = f'24h_{coin}'
+        cached = self._disk_cache_get(key, fresh_ttl=60, max_ttl=3600)
+        if cached is not None:
+            value, is_stale = cached
+            if is_stale:
+                logger.info(f"♻️ Serving stale 24h data for {coin}, refreshing in background...")
+                self._refresh_in_background(
+                    key, lambda: self._fetch_24h_volume_uncached(coin))
+            else:
+                logger.info(f"♻️ Serving cached 24h data for {coin}")
+            return value
 
-            exchange = self.exchanges[exchange_name]
-            try:
-                print(f"🔍 Processing {exchange_name}...")
+        value = self._fetch_24h_volume_uncached(coin)
+        self._disk_cache_put(key, value)
+        return value
 
-                # Load markets safely
-                markets = self._safe_load_markets(exchange, exchange_name)
-                if not markets:
-                    print(
-                        f"⚠️ {exchange_name} markets not available, skipping...")
+    def _fetch_24h_volume_uncached(self, coin: str = 'SOL') -> Dict[str, Dict]:
+        """Fetch 24h volume data from the exchanges (no disk cache)"""
+        logger.info(f"🔍 Fetching 24h volume data for {coin}...")
+        volume_data = {}
+        total_volume_usd = 0
+        self._get_krw_rate()
+
+        # Fan out all spot and perp ticker fetches concurrently - each task is
+        # pure I/O, so wall time is max(latencies) instead of the sum over
+        # exchanges and symbols.
+        async def gather_24h():
+            tasks = []
+            for exchange_name in self.exchange_priority:
+                if exchange_name not in self.exchanges:
                     continue
+                tasks.append(self._fetch_24h_task(exchange_name, coin))
+            for exchange_name in self.futures_exchanges:
+                tasks.append(self._fetch_24h_task(
+                    exchange_name, coin, futures=True))
 
-                exchange_volume = 0
-                exchange_data = {}
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
-                # Get all pairs for the coin
-                coin_symbols = [s for s in markets if s.startswith(f'{coin}/')]
+        results = asyncio.run(gather_24h())
 
-                if not coin_symbols:
-                    print(f"⚠️ {exchange_name} does not support {coin} pairs")
-                    continue
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"❌ concurrent 24h volume fetch failed: {str(result)}")
+                continue
+
+            exchange_name, exchange_data, exchange_volume, is_perp = result
+            if exchange_volume <= 0:
+                continue
 
-                for symbol in coin_symbols:
-                    try:
-                        ticker = self._safe_fetch_ticker(
-                            exchange, symbol, exchange_name)
-                        if not ticker:
-                            continue
-
-                        volume_24h = ticker.get('quoteVolume', 0) or ticker.get(
-                            'baseVolume', 0) or 0
-
-                        if volume_24h > 0:
-                            # Convert to USD (fixed rate)
-                            if symbol.endswith('/USDT') or symbol.endswith('/USDC') or symbol.endswith('/USD'):
-                                volume_usd = volume_24h
-                            elif symbol.endswith('/KRW'):
-                                # Convert KRW to USD (fixed rate 1350)
-                                volume_usd = volume_24h / 1350
-                            else:
-                                volume_usd = 0
-
-                            exchange_volume += volume_usd
-                            exchange_data[symbol] = {
-                                'volume_24h': volume_24h,
-                                'volume_usd': volume_usd,
-                                'price': ticker.get('last', 0),
-                                'timestamp': ticker.get('timestamp', time.time() * 1000),
-                                'type': 'spot'
-                            }
-                    except Exception as e:
-                        print(
-                            f"⚠️ {exchange_name} {symbol} spot data fetch failed: {str(e)}")
-
-                if exchange_volume > 0:
+            if is_perp:
+                # Add to existing exchange data or create new entry
+                if exchange_name in volume_data:
+                    volume_data[exchange_name]['perp_volume_usd'] = exchange_volume
+                    volume_data[exchange_name]['total_volume_usd'] += exchange_volume
+                    volume_data[exchange_name]['perp_data'] = exchange_data
+                else:
                     volume_data[exchange_name] = {
-                        'spot_volume_usd': exchange_volume,
-                        'perp_volume_usd': 0,
+                        'spot_volume_usd': 0,
+                        'perp_volume_usd': exchange_volume,
                         'total_volume_usd': exchange_volume,
-                        'spot_data': exchange_data
+                        'perp_data': exchange_data
                     }
-                    total_volume_usd += exchange_volume
-                    print(
-                        f"✅ {exchange_name} spot volume: ${exchange_volume:,.0f}")
-
-            except Exception as e:
-                print(f"❌ {exchange_name} spot volume fetch failed: {str(e)}")
-                continue
-
-        # Fetch perpetual futures volume data
-        for exchange_name, exchange in self.futures_exchanges.items():
-            try:
-                print(f"🔍 Processing {exchange_name} perpetual...")
-
-                markets = self._safe_load_markets(exchange, exchange_name)
-                if not markets:
-                    print(
-                        f"⚠️ {exchange_name} perpetual markets not available, skipping...")
-                    continue
-
-                perp_volume = 0
-                perp_data = {}
-
-                # Get all perp pairs for the coin
-                perp_symbols = []
-                for symbol in markets:
-                    if f'{coin}/USDT' in symbol or f'{coin}:USDT' in symbol:
-                        perp_symbols.append(symbol)
+                logger.info(
+                    f"✅ {exchange_name} perpetual volume: ${exchange_volume:,.0f}")
+            else:
+                volume_data[exchange_name] = {
+                    'spot_volume_usd': exchange_volume,
+                    'perp_volume_usd': 0,
+                    'total_volume_usd': exchange_volume,
+                    'spot_data': exchange_data
+                }
+                logger.info(
+                    f"✅ {exchange_name} spot volume: ${exchange_volume:,.0f}")
+            total_volume_usd += exchange_volume
 
-                if not perp_symbols:
-                    print(
-                        f"⚠️ {exchange_name} does not support {coin} perpetual pairs")
-                    continue
+        return volume_data, total_volume_usd
 
-                for symbol in perp_symbols:
-                    try:
-                        ticker = self._safe_fetch_ticker(
-                            exchange, symbol, exchange_name)
-                        if not ticker:
-                            continue
-
-                        volume_24h = ticker.get('quoteVolume', 0) or ticker.get(
-                            'baseVolume', 0) or 0
-
-                        if volume_24h > 0:
-                            # Perp volume is already in USD
-                            volume_usd = volume_24h
-
-                            perp_volume += volume_usd
-                            perp_data[symbol] = {
-                                'volume_24h': volume_24h,
-                                'volume_usd': volume_usd,
-                                'price': ticker.get('last', 0),
-                                'timestamp': ticker.get('timestamp', time.time() * 1000),
-                                'type': 'perp'
-                            }
-                    except Exception as e:
-                        print(
-                            f"⚠️ {exchange_name} {symbol} perp data fetch failed: {str(e)}")
-
-                if perp_volume > 0:
-                    # Add to existing exchange data or create new entry
-                    if exchange_name in volume_data:
-                        volume_data[exchange_name]['perp_volume_usd'] = perp_volume
-                        volume_data[exchange_name]['total_volume_usd'] += perp_volume
-                        volume_data[exchange_name]['perp_data'] = perp_data
-                    else:
-                        volume_data[exchange_name] = {
-                            'spot_volume_usd': 0,
-                            'perp_volume_usd': perp_volume,
-                            'total_volume_usd': perp_volume,
-                            'perp_data': perp_data
-                        }
-                    total_volume_usd += perp_volume
-                    print(
-                        f"✅ {exchange_name} perpetual volume: ${perp_volume:,.0f}")
+    def fetch_historical_data(self, coin: str = 'SOL', days: int = 14) -> pd.DataFrame:
+        """Fetch historical OHLCV data for the past N days including spot and perp (excluding today).
 
-            except Exception as e:
-                print(f"❌ {exchange_name} perp volume fetch failed: {str(e)}")
-                continue
+        Since the data excludes today, completed daily bars never change:
+        results are cached on disk keyed by (coin, days, date) and reused
+        for the rest of the day, with a stale-while-revalidate window for
+        entries fetched early in the day.
+        """
+        key = f'hist_{coin}_{days}_{datetime.now().date().isoformat()}'
+        cached = self._disk_cache_get(key, fresh_ttl=3600, max_ttl=86400)
+        if cached is not None:
+            value, is_stale = cached
+            if is_stale:
+                logger.info(f"♻️ Serving stale historical data for {coin}, refreshing in background...")
+                self._refresh_in_background(
+                    key, lambda: self._fetch_historical_uncached(coin, days))
+            else:
+                logger.info(f"♻️ Serving cached historical data for {coin}")
+            return value
 
-        return volume_data, total_volume_usd
+        value = self._fetch_historical_uncached(coin, days)
+        self._disk_cache_put(key, value)
+        return value
 
-    def fetch_historical_data(self, coin: str = 'SOL', days: int = 14) -> pd.DataFrame:
-        """Fetch historical OHLCV data for the past N days including spot and perp (excluding today)"""
-        print(
+    def _fetch_historical_uncached(self, coin: str = 'SOL', days: int = 14) -> pd.DataFrame:
+        """Fetch historical OHLCV data from the exchanges (no disk cache)"""
+        logger.info(
             f"📈 Fetching {days-1} days historical data for {coin} (excluding today)...")
-        historical_data = []
+
+        # Accumulate columns (SoA) instead of a list of per-row dicts - the
+        # OHLCV payloads arrive as numeric tuples, so each exchange's chunk
+        # can be converted to a NumPy block and sliced column-wise, and the
+        # DataFrame is built once from arrays at the end.
+        dates = []
+        exchange_col = []
+        symbol_col = []
+        type_col = []
+        numeric_chunks = {'volume_base': [], 'volume_usd': [],
+                          'open': [], 'high': [], 'low': [], 'close': []}
 
         # Spot trading pairs
         spot_pairs = {
@@ -545,7 +984,7 @@ class ExchangeVolumeAnalyzer:
 
         # For Streamlit Cloud, limit days to avoid timeout
         if self.is_streamlit_cloud and days > 14:
-            print(
+            logger.info(
                 "🔧 Streamlit Cloud detected - limiting to 14 days for better performance")
             days = 14
 
@@ -557,200 +996,179 @@ class ExchangeVolumeAnalyzer:
             'kucoin': f'{coin}/USDT'
         }
 
-        # Fetch spot historical data - use priority order for Streamlit Cloud
-        successful_spot_exchanges = []
-        for exchange_name in self.exchange_priority:
-            if exchange_name not in spot_pairs:
-                continue
-
-            symbol = spot_pairs[exchange_name]
-            if exchange_name not in self.exchanges:
-                continue
-
-            exchange = self.exchanges[exchange_name]
-
-            try:
-                print(f"🔍 Fetching spot data from {exchange_name}...")
-
-                # Load markets safely
-                markets = self._safe_load_markets(exchange, exchange_name)
-                if not markets:
-                    print(
-                        f"⚠️ {exchange_name} markets not available, skipping...")
+        # Fetch spot and perp OHLCV from all exchanges concurrently - the
+        # calls are pure I/O, so wall time is max(latencies) instead of the
+        # sum over exchanges.
+        async def gather_ohlcv():
+            tasks = []
+            for exchange_name in self.exchange_priority:
+                if exchange_name not in spot_pairs or exchange_name not in self.exchanges:
                     continue
-
-                if symbol not in markets:
-                    print(
-                        f"⚠️ {exchange_name} does not support {symbol} (spot)")
+                tasks.append(self._fetch_ohlcv_task(
+                    exchange_name, spot_pairs[exchange_name], coin, '1d', days-1))
+            for exchange_name in perp_pairs:
+                if exchange_name not in self.futures_exchanges:
                     continue
+                tasks.append(self._fetch_ohlcv_task(
+                    exchange_name, perp_pairs[exchange_name], coin, '1d', days-1,
+                    futures=True))
 
-                # Fetch daily OHLCV data (excluding today)
-                print(f"📊 Fetching OHLCV from {exchange_name} for {symbol}...")
-                ohlcv_data = self._safe_fetch_ohlcv(
-                    exchange, symbol, '1d', days-1, exchange_name)
-
-                if ohlcv_data and len(ohlcv_data) > 0:
-                    for ohlcv in ohlcv_data:
-                        timestamp, open_price, high, low, close, volume = ohlcv
-                        # Fix timezone issue for Bithumb
-                        if exchange_name == 'bithumb':
-                            # Bithumb returns UTC time but with different day boundary
-                            # Add 9 hours to align with other exchanges
-                            date = datetime.fromtimestamp(
-                                (timestamp + 9 * 3600 * 1000) / 1000).date()
-                        else:
-                            date = datetime.fromtimestamp(
-                                timestamp / 1000).date()
-
-                        if symbol.endswith('/KRW'):
-                            volume_usd = volume * close / 1350
-                        else:
-                            volume_usd = volume * close
-
-                        historical_data.append({
-                            'date': date,
-                            'exchange': exchange_name,
-                            'symbol': symbol,
-                            'volume_base': volume,
-                            'volume_usd': volume_usd,
-                            'open': open_price,
-                            'high': high,
-                            'low': low,
-                            'close': close,
-                            'type': 'spot'
-                        })
-                    successful_spot_exchanges.append(exchange_name)
-                    print(
-                        f"✅ {exchange_name} spot data: {len(ohlcv_data)} records")
-                else:
-                    print(f"⚠️ {exchange_name} returned empty spot data")
+            logger.info(f"🔍 Fetching OHLCV from {len(tasks)} endpoints concurrently...")
+            return await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as e:
-                print(f"❌ {exchange_name} spot data fetch failed: {str(e)}")
-                continue
+        krw_rate = self._get_krw_rate()
+        results = asyncio.run(gather_ohlcv())
 
-        # Fetch perpetual futures historical data
+        successful_spot_exchanges = []
         successful_perp_exchanges = []
-        for exchange_name, symbol in perp_pairs.items():
-            if exchange_name not in self.futures_exchanges:
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"❌ concurrent OHLCV fetch failed: {str(result)}")
                 continue
 
-            exchange = self.futures_exchanges[exchange_name]
-
-            try:
-                print(f"🔍 Fetching perp data from {exchange_name}...")
+            exchange_name, symbol, ohlcv_data, is_perp = result
+            label = 'perp' if is_perp else 'spot'
 
-                markets = self._safe_load_markets(exchange, exchange_name)
-                if not markets:
-                    print(
-                        f"⚠️ {exchange_name} perpetual markets not available, skipping...")
-                    continue
+            if not ohlcv_data:
+                logger.warning(f"⚠️ {exchange_name} returned empty {label} data")
+                continue
 
-                perp_symbol = None
-                for market_symbol in markets:
-                    if f'{coin}/USDT' in market_symbol or f'{coin}:USDT' in market_symbol:
-                        perp_symbol = market_symbol
-                        break
+            arr = np.asarray(ohlcv_data, dtype=np.float64)
+            timestamps = arr[:, 0]
+            # Fix timezone issue for Bithumb: it returns UTC time but with a
+            # different day boundary, so add 9 hours to align with the others
+            if exchange_name == 'bithumb':
+                timestamps = timestamps + 9 * 3600 * 1000
+            # Keep dates as native datetime64 (floored to the day) - groupby
+            # and comparisons on datetime64 are much faster than on object
+            # columns of Python date instances
+            dates.append(
+                pd.to_datetime(timestamps, unit='ms').floor('D').values)
+
+            close = arr[:, 4]
+            volume = arr[:, 5]
+            volume_usd = volume * close
+            if not is_perp and symbol.endswith('/KRW'):
+                volume_usd /= krw_rate
+
+            n_rows = len(arr)
+            exchange_col.extend(
+                [f"{exchange_name}_perp" if is_perp else exchange_name] * n_rows)
+            symbol_col.extend([symbol] * n_rows)
+            type_col.extend([label] * n_rows)
+            numeric_chunks['volume_base'].append(volume)
+            numeric_chunks['volume_usd'].append(volume_usd)
+            numeric_chunks['open'].append(arr[:, 1])
+            numeric_chunks['high'].append(arr[:, 2])
+            numeric_chunks['low'].append(arr[:, 3])
+            numeric_chunks['close'].append(close)
+
+            if is_perp:
+                successful_perp_exchanges.append(exchange_name)
+            else:
+                successful_spot_exchanges.append(exchange_name)
+            logger.info(
+                f"✅ {exchange_name} {label} data: {len(ohlcv_data)} records")
 
-                if not perp_symbol:
-                    print(
-                        f"⚠️ {exchange_name} does not support {coin} perpetual")
-                    continue
+        logger.info(
+            f"📊 Successfully fetched data from {len(successful_spot_exchanges)} spot exchanges and {len(successful_perp_exchanges)} perp exchanges")
 
-                ohlcv_data = self._safe_fetch_ohlcv(
-                    exchange, perp_symbol, '1d', days-1, exchange_name)
-
-                if ohlcv_data and len(ohlcv_data) > 0:
-                    for ohlcv in ohlcv_data:
-                        timestamp, open_price, high, low, close, volume = ohlcv
-                        # Fix timezone issue for Bithumb
-                        if exchange_name == 'bithumb':
-                            # Bithumb returns UTC time but with different day boundary
-                            # Add 9 hours to align with other exchanges
-                            date = datetime.fromtimestamp(
-                                (timestamp + 9 * 3600 * 1000) / 1000).date()
-                        else:
-                            date = datetime.fromtimestamp(
-                                timestamp / 1000).date()
-                        volume_usd = volume * close
-
-                        historical_data.append({
-                            'date': date,
-                            'exchange': f"{exchange_name}_perp",
-                            'symbol': perp_symbol,
-                            'volume_base': volume,
-                            'volume_usd': volume_usd,
-                            'open': open_price,
-                            'high': high,
-                            'low': low,
-                            'close': close,
-                            'type': 'perp'
-                        })
-                    successful_perp_exchanges.append(exchange_name)
-                    print(
-                        f"✅ {exchange_name} perp data: {len(ohlcv_data)} records")
-                else:
-                    print(f"⚠️ {exchange_name} returned empty perp data")
+        if not dates:
+            return pd.DataFrame()
+
+        # Assemble an Arrow table from the typed buffers and convert to
+        # pandas once - numeric columns are zero-copy, and dictionary
+        # encoding the repetitive label columns keeps them categorical
+        # rather than per-row Python strings.
+        table = pa.table({
+            'date': pa.array(np.concatenate(dates)),
+            'exchange': pa.array(exchange_col).dictionary_encode(),
+            'symbol': pa.array(symbol_col).dictionary_encode(),
+            **{name: pa.array(np.concatenate(chunks), type=pa.float32())
+               for name, chunks in numeric_chunks.items()},
+            'type': pa.array(type_col).dictionary_encode()
+        })
+        return table.to_pandas(self_destruct=True)
+
+    async def _fetch_price_task(self, exchange_name, coin):
+        """Fetch the current price from one exchange for asyncio.as_completed"""
+        exchange = self._build_async_exchange(exchange_name)
+        try:
+            # Try USDT pair first
+            symbol = f'{coin}/USDT'
+            if exchange_name == 'coinbase':
+                symbol = f'{coin}/USD'
 
+            try:
+                ticker = await self._retry_request_async(
+                    lambda: exchange.fetch_ticker(symbol),
+                    max_retries=2, base_delay=1)
+                if ticker:
+                    self._track_success(
+                        exchange_name, f"fetch_ticker({symbol})")
+                    return exchange_name, ticker.get('last', 0) or 0
             except Exception as e:
-                print(f"❌ {exchange_name} perp data fetch failed: {str(e)}")
-                continue
-
-        print(
-            f"📊 Successfully fetched data from {len(successful_spot_exchanges)} spot exchanges and {len(successful_perp_exchanges)} perp exchanges")
-
-        df = pd.DataFrame(historical_data)
-        return df
+                logger.warning(
+                    f"⚠️ Failed to get current price from {exchange_name}: {str(e)}")
+                self._track_error(exchange_name, f"fetch_ticker({symbol})", e)
+            return exchange_name, 0
+        finally:
+            await exchange.close()
 
     def get_current_price(self, coin: str = 'SOL') -> float:
-        """Get current price from major exchanges"""
-        prices = []
+        """Get current price averaged from major exchanges.
+
+        All exchanges are queried concurrently, and once three prices have
+        arrived the remaining (slower or failing) requests are cancelled.
+        The result is memoized per minute bucket - Streamlit reruns the
+        whole script on every interaction, and a 60s-old price is fine.
+        """
+        bucket = int(time.time() // 60)
+        cached = self._price_cache.get(coin)
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
 
         # Try to get current price from major exchanges
         major_exchanges = ['kraken', 'coinbase', 'okx', 'bybit', 'binance']
 
-        for exchange_name in major_exchanges:
-            if exchange_name not in self.exchanges:
-                continue
-
-            exchange = self.exchanges[exchange_name]
-
+        async def gather_prices():
+            tasks = [asyncio.create_task(self._fetch_price_task(name, coin))
+                     for name in major_exchanges if name in self.exchanges]
+            collected = []
             try:
-                # Try USDT pair first
-                symbol = f'{coin}/USDT'
-                if exchange_name == 'coinbase':
-                    symbol = f'{coin}/USD'
-
-                ticker = self._safe_fetch_ticker(
-                    exchange, symbol, exchange_name)
-                if not ticker:
-                    continue
-
-                current_price = ticker.get('last', 0)
-
-                if current_price > 0:
-                    prices.append(current_price)
-                    print(
-                        f"✅ Current price from {exchange_name}: ${current_price}")
-
-            except Exception as e:
-                print(
-                    f"⚠️ Failed to get current price from {exchange_name}: {str(e)}")
-                continue
+                for future in asyncio.as_completed(tasks):
+                    exchange_name, price = await future
+                    if price > 0:
+                        collected.append(price)
+                        logger.info(
+                            f"✅ Current price from {exchange_name}: ${price}")
+                        if len(collected) >= 3:
+                            break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Let cancelled tasks close their async clients
+                await asyncio.gather(*tasks, return_exceptions=True)
+            return collected
+
+        prices = asyncio.run(gather_prices())
 
         if prices:
             # Return average price
             avg_price = sum(prices) / len(prices)
-            print(f"💰 Average current price: ${avg_price}")
+            logger.info(f"💰 Average current price: ${avg_price}")
+            # Only cache successful lookups so a transient outage doesn't
+            # pin a zero price for the rest of the minute
+            self._price_cache[coin] = (bucket, avg_price)
             return avg_price
         else:
-            print("❌ Could not fetch current price from any exchange")
+            logger.warning("❌ Could not fetch current price from any exchange")
             return 0.0
 
     def get_today_data(self, coin: str = 'SOL') -> pd.DataFrame:
         """Get today's data - return empty DataFrame to avoid inflated volume"""
-        print(f"📊 Getting today's data for {coin}...")
-        print("⚠️ Today's volume data excluded to avoid inflated comparisons")
+        logger.info(f"📊 Getting today's data for {coin}...")
+        logger.info("⚠️ Today's volume data excluded to avoid inflated comparisons")
 
         # Return empty DataFrame - we'll only use historical data for accurate comparison
         return pd.DataFrame()
@@ -760,97 +1178,164 @@ class ExchangeVolumeAnalyzer:
         if df.empty:
             return df
 
-        # Calculate total daily volume
-        daily_totals = df.groupby('date')['volume_usd'].sum().reset_index()
-        daily_totals.rename(
-            columns={'volume_usd': 'total_daily_volume'}, inplace=True)
-
-        # Calculate daily market share per exchange
-        df = df.merge(daily_totals, on='date')
-        df['market_share_pct'] = (
-            df['volume_usd'] / df['total_daily_volume'] * 100)
+        # Daily market share per exchange - transform('sum') broadcasts the
+        # per-date totals back onto the rows, avoiding the groupby+merge and
+        # its intermediate frame. The divide and scale run in-place on one
+        # owned float32 buffer (the report renders shares at one decimal, so
+        # single precision is far more than enough).
+        df = df.copy()
+        shares = df['volume_usd'].to_numpy(dtype=np.float32, copy=True)
+        totals = df.groupby(
+            'date', sort=False)['volume_usd'].transform('sum').to_numpy()
+        np.divide(shares, totals, out=shares)
+        np.multiply(shares, 100.0, out=shares)
+        df['market_share_pct'] = shares
 
         return df
 
-    def generate_report(self, coin: str = 'SOL') -> str:
-        """Generate comprehensive report"""
-        print(f"\n=== {coin} Exchange Volume Analysis Report ===\n")
+    def generate_report(self, coin: str = 'SOL') -> Tuple[str, pd.DataFrame]:
+        """Generate comprehensive report.
 
-        current_data, total_volume = self.fetch_24h_volume_data(coin)
+        Returns (report, historical_df) so callers can reuse the fetched
+        historical frame instead of re-downloading it. The whole report is
+        assembled in one StringIO buffer and flushed to stdout in a single
+        write, and the returned string is that same buffer.
+        """
+        buf = io.StringIO()
+        buf.write(f"\n=== {coin} Exchange Volume Analysis Report ===\n\n")
+
+        # One clock read serves both the 7-day cutoff and the report header
+        now = pd.Timestamp.now()
+
+        # The 24h and historical fetches are independent, so overlap them:
+        # each runs its own event loop on a worker thread and the report
+        # waits on whichever finishes last instead of both in sequence
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            current_future = pool.submit(self.fetch_24h_volume_data, coin)
+            historical_future = pool.submit(
+                self.fetch_historical_data, coin, 14)
+            current_data, total_volume = current_future.result()
+            historical_df = historical_future.result()
+
+        # One pass over current_data: spot/perp totals, the KRW / non-KRW
+        # share split and the top exchange all accumulate together instead
+        # of five separate traversals
+        total_spot = 0.0
+        total_perp = 0.0
+        krw_share = 0.0
+        non_krw_share = 0.0
+        top_exchange = 'N/A'
+        top_volume = -1.0
+        for name, data in current_data.items():
+            total_spot += data['spot_volume_usd']
+            total_perp += data['perp_volume_usd']
+            volume = data['total_volume_usd']
+            share = volume / total_volume * 100 if total_volume > 0 else 0.0
+            if name in self.krw_exchanges:
+                krw_share += share
+            else:
+                non_krw_share += share
+            if volume > top_volume:
+                top_volume = volume
+                top_exchange = name
 
         if current_data:
-            sorted_exchanges = sorted(
-                current_data.items(),
-                key=lambda x: x[1]['total_volume_usd'],
-                reverse=True
-            )
-
+            # Decorate-sort-undecorate: pulling the volume out once lets
+            # sorted() compare plain floats instead of calling a lambda per
+            # comparison
+            decorated = [(data['total_volume_usd'], exchange, data)
+                         for exchange, data in current_data.items()]
+            decorated.sort(reverse=True)
+            sorted_exchanges = [(exchange, data)
+                                for _, exchange, data in decorated]
+
+            # Build the ranking once and append it to the report buffer
+            ranking_lines = []
             for i, (exchange, data) in enumerate(sorted_exchanges, 1):
-                spot_vol = data.get('spot_volume_usd', 0)
-                perp_vol = data.get('perp_volume_usd', 0)
-
-                if perp_vol > 0:
-                    print(f"{i}. {exchange.upper()}: "
-                          f"${data['total_volume_usd']:,.0f} "
-                          f"({data['market_share_pct']:.1f}%) "
-                          f"[Spot: ${spot_vol:,.0f}, Perp: ${perp_vol:,.0f}]")
-                else:
-                    print(f"{i}. {exchange.upper()}: "
-                          f"${data['total_volume_usd']:,.0f} "
-                          f"({data['market_share_pct']:.1f}%) "
-                          f"[Spot only]")
+                spot_vol = data['spot_volume_usd']
+                perp_vol = data['perp_volume_usd']
+                share = (data['total_volume_usd'] / total_volume * 100
+                         if total_volume > 0 else 0.0)
 
-            print(f"\nTotal Volume: ${total_volume:,.0f}")
+                tmpl = _RANK_PERP_TMPL if perp_vol > 0 else _RANK_SPOT_TMPL
+                ranking_lines.append(tmpl.format(
+                    i=i, name=exchange.upper(),
+                    total=data['total_volume_usd'], share=share,
+                    spot=spot_vol, perp=perp_vol))
+            buf.write('\n'.join(ranking_lines))
 
-            # Calculate spot vs perp breakdown
-            total_spot = sum(data.get('spot_volume_usd', 0)
-                             for data in current_data.values())
-            total_perp = sum(data.get('perp_volume_usd', 0)
-                             for data in current_data.values())
+            buf.write(f"\n\nTotal Volume: ${total_volume:,.0f}\n")
 
             if total_volume > 0:
-                print(
-                    f"Spot Volume: ${total_spot:,.0f} ({total_spot/total_volume*100:.1f}%)")
-                print(
-                    f"Perp Volume: ${total_perp:,.0f} ({total_perp/total_volume*100:.1f}%)")
+                buf.write(
+                    f"Spot Volume: ${total_spot:,.0f} ({total_spot/total_volume*100:.1f}%)\n")
+                buf.write(
+                    f"Perp Volume: ${total_perp:,.0f} ({total_perp/total_volume*100:.1f}%)\n")
 
-        print(f"\n📈 Market Share Trend for the Last 14 Days")
-        historical_df = self.fetch_historical_data(coin, 14)
+        buf.write("\n📈 Market Share Trend for the Last 14 Days\n")
 
         if not historical_df.empty:
-            share_df = self.calculate_daily_market_share(historical_df)
+            # Only date/exchange/volume feed the share math and the 7-day
+            # average, so the OHLC columns never get copied along
+            share_df = self.calculate_daily_market_share(
+                historical_df[['date', 'exchange', 'volume_usd']])
 
             # 7-day average market share
-            recent_week = share_df[share_df['date'] >=
-                                   (datetime.now().date() - timedelta(days=7))]
+            week_ago = now.normalize() - pd.Timedelta(days=7)
+            recent_week = share_df[share_df['date'] >= week_ago]
 
             if not recent_week.empty:
+                # observed=True keeps absent categorical levels out of the
+                # aggregation; sorting once and iterating items() avoids a
+                # label lookup per exchange
                 avg_shares = recent_week.groupby(
-                    'exchange')['market_share_pct'].mean()
-                print("\n7-Day Average Market Share:")
-                for exchange in avg_shares.sort_values(ascending=False).index:
-                    print(f"- {exchange.upper()}: {avg_shares[exchange]:.1f}%")
-
-        # 3. Detailed Analysis
-        report = f"""
+                    'exchange', observed=True,
+                    sort=False)['market_share_pct'].mean()
+                avg_shares = avg_shares.sort_values(ascending=False)
+                buf.write("\n7-Day Average Market Share:\n")
+                for exchange, share in avg_shares.items():
+                    buf.write(f"- {exchange.upper()}: {share:.1f}%\n")
+
+        # 3. Detailed Analysis (accumulated in the single pass above)
+        buf.write(f"""
 🔍 Detailed Analysis Result
 
 Coin: {coin}
-Analysis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Analysis Time: {now.strftime('%Y-%m-%d %H:%M:%S')}
 Number of Exchanges: {len(current_data)}
 
 Key Findings:
-1. Top Exchange by Volume: {max(current_data.items(), key=lambda x: x[1]['total_volume_usd'])[0].upper() if current_data else 'N/A'}
-2. KRW Exchange Share: {sum(data['market_share_pct'] for name, data in current_data.items() if name in self.krw_exchanges):.1f}%
-3. Non-KRW Exchange Share: {sum(data['market_share_pct'] for name, data in current_data.items() if name not in self.krw_exchanges):.1f}%
-        """
+1. Top Exchange by Volume: {top_exchange.upper()}
+2. KRW Exchange Share: {krw_share:.1f}%
+3. Non-KRW Exchange Share: {non_krw_share:.1f}%
+        """)
+
+        report = buf.getvalue()
+        sys.stdout.write(report + '\n')
+        return report, historical_df
+
 
-        print(report)
-        return report
+def _strip_perp_suffix(exchange: pd.Series) -> pd.Series:
+    """Strip the '_perp' suffix from the exchange column, keeping it categorical.
+
+    Operating on the (few) categories and remapping codes means the groupby
+    that follows hashes integer codes instead of Python strings.
+    """
+    if not isinstance(exchange.dtype, pd.CategoricalDtype):
+        return exchange.str.removesuffix('_perp').astype('category')
+
+    bases = [c.removesuffix('_perp') for c in exchange.cat.categories]
+    unique_bases = list(dict.fromkeys(bases))
+    remap = np.array([unique_bases.index(b) for b in bases])
+    codes = remap[exchange.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, unique_bases),
+                     index=exchange.index)
 
 
 def main():
     """Main execution function"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     analyzer = ExchangeVolumeAnalyzer()
 
     # Example usage
@@ -865,36 +1350,43 @@ def main():
 
     # 2. Generate comprehensive report
     print("\n2️⃣ Generating comprehensive analysis report...")
-    report = analyzer.generate_report('PENGU')
+    report, historical_df = analyzer.generate_report('PENGU')
 
-    # 3. Print 14-day historical volume table
+    # 3. Print 14-day historical volume table (reusing the report's frame)
     print("\n14-Day Historical Exchange Volume Table (Spot + Perp):")
-    historical_df = analyzer.fetch_historical_data('PENGU', 14)
     if not historical_df.empty:
-        # Group by date and exchange (combining spot and perp for same exchange)
-        historical_df['exchange_base'] = historical_df['exchange'].str.replace(
-            '_perp', '')
-        daily_volume = historical_df.groupby(['date', 'exchange_base'])[
-            'volume_usd'].sum().reset_index()
-        pivot_table = daily_volume.pivot(
-            index='date', columns='exchange_base', values='volume_usd').fillna(0).round(2)
-        print(pivot_table)
-
-        # Show spot vs perp breakdown
-        print("\nSpot vs Perp Volume Breakdown:")
-        type_breakdown = historical_df.groupby('type')['volume_usd'].sum()
-        for vol_type, volume in type_breakdown.items():
-            print(f"{vol_type.upper()}: ${volume:,.0f}")
+        # Group by date and exchange (combining spot and perp for same
+        # exchange). unstack(fill_value=...) off the grouped Series skips
+        # pivot_table's NaN-materialize-then-fill pass.
+        pivot_table = historical_df.assign(
+            exchange_base=_strip_perp_suffix(historical_df['exchange'])
+        ).groupby(['date', 'exchange_base'],
+                  observed=True)['volume_usd'].sum().unstack(fill_value=0.0)
+        # Format at render time instead of round(2) materializing a rounded
+        # copy of the whole table first
+        print(pivot_table.to_string(float_format='{:,.2f}'.format))
+
+        # Show spot vs perp breakdown in one write
+        type_breakdown = historical_df.groupby(
+            'type', observed=True)['volume_usd'].sum()
+        print("\nSpot vs Perp Volume Breakdown:\n" + '\n'.join(
+            f"{vol_type.upper()}: ${volume:,.0f}"
+            for vol_type, volume in type_breakdown.items()))
     else:
         print("No historical data available.")
 
     # 4. Historical data summary
     if not historical_df.empty:
-        print(f"\nHistorical data summary:")
-        print(
-            f"Date range: {historical_df['date'].min()} to {historical_df['date'].max()}")
-        print(f"Total records: {len(historical_df)}")
-        print(f"Exchanges: {', '.join(historical_df['exchange'].unique())}")
+        # min/max on the raw datetime64 array and the categorical's
+        # categories (already the distinct exchanges) skip the Series
+        # reductions; one print flushes the whole block
+        dates = historical_df['date'].to_numpy()
+        print("\nHistorical data summary:\n"
+              f"Date range: {pd.Timestamp(dates.min())} "
+              f"to {pd.Timestamp(dates.max())}\n"
+              f"Total records: {len(historical_df)}\n"
+              f"Exchanges: "
+              f"{', '.join(historical_df['exchange'].cat.categories)}")
     else:
         print("No historical data available.")
 